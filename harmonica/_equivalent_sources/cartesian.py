@@ -17,7 +17,6 @@ import verde.base as vdb
 from numba import jit
 from sklearn.utils.validation import check_is_fitted
 
-from .._forward.utils import distance_cartesian
 from .utils import (
     cast_fit_input,
     jacobian_numba_parallel,
@@ -597,7 +596,9 @@ def greens_func_cartesian(east, north, upward, point_east, point_north, point_up
 
     Uses Numba to speed up things.
     """
-    distance = distance_cartesian(
-        (east, north, upward), (point_east, point_north, point_upward)
+    distance = np.sqrt(
+        (east - point_east) ** 2
+        + (north - point_north) ** 2
+        + (upward - point_upward) ** 2
     )
     return 1 / distance
@@ -24,7 +24,7 @@ from choclo.point import (
 )
 from numba import jit, prange
 
-from .utils import check_coordinate_system, distance_spherical_core
+from .utils import FASTMATH, check_coordinate_system, distance_spherical_core
 
 
 def point_gravity(
@@ -112,7 +112,10 @@ def point_gravity(
         by an already parallelized workflow. Default to True.
     dtype : data-type (optional)
         Data type assigned to resulting gravitational field. Default to
-        ``np.float64``.
+        ``np.float64``. The field of each computation point is always
+        accumulated in double precision and then stored with this data type,
+        so ``np.float32`` halves the memory of the output without losing
+        accuracy on the summation.
 
     Returns
     -------
@@ -231,13 +234,16 @@ def point_gravity(
     check_coordinate_system(
         coordinate_system, valid_coord_systems=("cartesian", "spherical")
     )
-    # Figure out the shape and size of the output array
-    cast = np.broadcast(*coordinates[:3])
-    result = np.zeros(cast.size, dtype=dtype)
-    # Prepare arrays to be passed to the jitted functions
-    coordinates = tuple(np.atleast_1d(i).ravel() for i in coordinates[:3])
-    points = tuple(np.atleast_1d(i).ravel() for i in points[:3])
-    masses = np.atleast_1d(masses).ravel()
+    # Broadcast the coordinates and figure out the shape and size of the
+    # output array
+    coordinates = np.broadcast_arrays(*coordinates[:3])
+    shape = coordinates[0].shape
+    result = np.zeros(coordinates[0].size, dtype=dtype)
+    # Prepare arrays to be passed to the jitted functions (no copies are made
+    # for inputs that are already contiguous)
+    coordinates = tuple(np.ascontiguousarray(i).ravel() for i in coordinates)
+    points = tuple(np.ascontiguousarray(i).ravel() for i in points[:3])
+    masses = np.ascontiguousarray(masses).ravel()
     # Sanity checks
     if masses.size != points[0].size:
         raise ValueError(
@@ -247,18 +253,9 @@ def point_gravity(
     # Compute gravitational field
     kernel = get_kernel(coordinate_system, field)
     dispatcher(coordinate_system, parallel)(
-        *coordinates, *points, masses, result, kernel
+        *coordinates, *points, masses, result, kernel, get_scale(field)
     )
-    # Invert sign of gravity_u, gravity_eu, gravity_nu
-    if field in ("g_z", "g_ez", "g_ze", "g_nz", "g_zn"):
-        result *= -1
-    # Convert to more convenient units
-    if field in ("g_e", "g_n", "g_z"):
-        result *= 1e5  # SI to mGal
-    tensors = ("g_ee", "g_nn", "g_zz", "g_en", "g_ez", "g_nz", "g_ne", "g_ze", "g_zn")
-    if field in tensors:
-        result *= 1e9  # SI to Eotvos
-    return result.reshape(cast.shape)
+    return result.reshape(shape)
 
 
 def dispatcher(coordinate_system, parallel):
@@ -301,8 +298,8 @@ def get_kernel(coordinate_system, field):
             "g_zn": gravity_nu,
         },
         "spherical": {
-            "potential": potential_spherical,
-            "g_z": gravity_u_spherical,
+            "potential": potential_spherical_trig,
+            "g_z": gravity_u_spherical_trig,
             "g_n": None,
             "g_e": None,
         },
@@ -315,12 +312,32 @@ def get_kernel(coordinate_system, field):
     return kernel
 
 
+def get_scale(field):
+    """
+    Return the factor that the output of the kernel must be multiplied by
+
+    It inverts the sign of the upward components and converts the field to
+    more convenient units.
+    """
+    scale = 1.0
+    # Invert sign of gravity_u, gravity_eu, gravity_nu
+    if field in ("g_z", "g_ez", "g_ze", "g_nz", "g_zn"):
+        scale *= -1
+    # Convert to more convenient units
+    if field in ("g_e", "g_n", "g_z"):
+        scale *= 1e5  # SI to mGal
+    tensors = ("g_ee", "g_nn", "g_zz", "g_en", "g_ez", "g_nz", "g_ne", "g_ze", "g_zn")
+    if field in tensors:
+        scale *= 1e9  # SI to Eotvos
+    return scale
+
+
 # ------------------------------------------
 # Kernel functions for Spherical coordinates
 # ------------------------------------------
 
 
-@jit(nopython=True)
+@jit(nopython=True, fastmath=FASTMATH, error_model="numpy")
 def potential_spherical(
     longitude, cosphi, sinphi, radius, longitude_p, cosphi_p, sinphi_p, radius_p
 ):
@@ -337,7 +354,7 @@ def potential_spherical(
 #  -------------------
 
 
-@jit(nopython=True)
+@jit(nopython=True, fastmath=FASTMATH, error_model="numpy")
 def gravity_u_spherical(
     longitude, cosphi, sinphi, radius, longitude_p, cosphi_p, sinphi_p, radius_p
 ):
@@ -350,7 +367,103 @@ def gravity_u_spherical(
         longitude, cosphi, sinphi, radius, longitude_p, cosphi_p, sinphi_p, radius_p
     )
     delta_z = radius - radius_p * cospsi
-    return -GRAVITATIONAL_CONST * delta_z / distance**3
+    return -GRAVITATIONAL_CONST * delta_z / (distance * distance * distance)
+
+
+@jit(nopython=True, fastmath=FASTMATH, error_model="numpy")
+def _distance_spherical_trig(
+    coslambda,
+    sinlambda,
+    cosphi,
+    sinphi,
+    radius,
+    coslambda_p,
+    sinlambda_p,
+    cosphi_p,
+    sinphi_p,
+    radius_p,
+):
+    r"""
+    Distance between two points given the cosine and sine of their longitudes
+
+    Equivalent to :func:`harmonica._forward.utils.distance_spherical_core`,
+    but the cosine of the longitudinal difference is obtained through
+    :math:`\cos(\lambda - \lambda_p) = \cos\lambda \cos\lambda_p +
+    \sin\lambda \sin\lambda_p`, so no trigonometric function needs to be
+    evaluated for each pair of points.
+    """
+    coslambda_diff = coslambda_p * coslambda + sinlambda_p * sinlambda
+    cospsi = sinphi_p * sinphi + cosphi_p * cosphi * coslambda_diff
+    distance = np.sqrt((radius - radius_p) ** 2 + 2 * radius * radius_p * (1 - cospsi))
+    return distance, cospsi
+
+
+@jit(nopython=True, fastmath=FASTMATH, error_model="numpy")
+def potential_spherical_trig(
+    coslambda,
+    sinlambda,
+    cosphi,
+    sinphi,
+    radius,
+    coslambda_p,
+    sinlambda_p,
+    cosphi_p,
+    sinphi_p,
+    radius_p,
+):
+    """
+    Kernel function for potential gravitational field in spherical coordinates
+
+    Takes the cosine and sine of the longitudes instead of the longitudes.
+    """
+    distance, _ = _distance_spherical_trig(
+        coslambda,
+        sinlambda,
+        cosphi,
+        sinphi,
+        radius,
+        coslambda_p,
+        sinlambda_p,
+        cosphi_p,
+        sinphi_p,
+        radius_p,
+    )
+    return 1 / distance * GRAVITATIONAL_CONST
+
+
+@jit(nopython=True, fastmath=FASTMATH, error_model="numpy")
+def gravity_u_spherical_trig(
+    coslambda,
+    sinlambda,
+    cosphi,
+    sinphi,
+    radius,
+    coslambda_p,
+    sinlambda_p,
+    cosphi_p,
+    sinphi_p,
+    radius_p,
+):
+    """
+    Kernel for upward component of gravitational acceleration
+
+    Use spherical coordinates. Takes the cosine and sine of the longitudes
+    instead of the longitudes.
+    """
+    distance, cospsi = _distance_spherical_trig(
+        coslambda,
+        sinlambda,
+        cosphi,
+        sinphi,
+        radius,
+        coslambda_p,
+        sinlambda_p,
+        cosphi_p,
+        sinphi_p,
+        radius_p,
+    )
+    delta_z = radius - radius_p * cospsi
+    return -GRAVITATIONAL_CONST * delta_z / (distance * distance * distance)
 
 
 def point_mass_cartesian(
@@ -363,6 +476,7 @@ def point_mass_cartesian(
     masses,
     out,
     forward_func,
+    scale,
 ):
     """
     Compute gravitational field of point masses in Cartesian coordinates
@@ -383,22 +497,39 @@ def point_mass_cartesian(
         forward_func function that will be used to compute the gravitational
         field on the computation points. It could be one of the forward
         modelling functions in :mod:`choclo.point`.
+    scale : float
+        Factor applied to the field of the point masses on each computation
+        point before it's added to ``out``.
     """
     for l in prange(easting.size):
+        # Accumulate the field of every point mass on a local variable so it
+        # can be kept in a register instead of updating out[l] on each step
+        easting_l, northing_l, upward_l = easting[l], northing[l], upward[l]
+        result = 0.0
         for m in range(easting_p.size):
-            out[l] += forward_func(
-                easting[l],
-                northing[l],
-                upward[l],
+            result += forward_func(
+                easting_l,
+                northing_l,
+                upward_l,
                 easting_p[m],
                 northing_p[m],
                 upward_p[m],
                 masses[m],
             )
+        out[l] += scale * result
 
 
 def point_mass_spherical(
-    longitude, latitude, radius, longitude_p, latitude_p, radius_p, masses, out, kernel
+    longitude,
+    latitude,
+    radius,
+    longitude_p,
+    latitude_p,
+    radius_p,
+    masses,
+    out,
+    kernel,
+    scale,
 ):
     """
     Compute gravitational field of point masses in spherical coordinates
@@ -419,35 +550,53 @@ def point_mass_spherical(
         ``radius``.
     kernel : func
         Kernel function that will be used to compute the gravitational field on
-        the computation points.
+        the computation points. It takes the cosine and sine of the longitude
+        and latitude of both points instead of the longitudes.
+    scale : float
+        Factor applied to the field of the point masses on each computation
+        point before it's added to ``out``.
     """
-    # Compute quantities related to computation point
-    longitude = np.radians(longitude)
-    latitude = np.radians(latitude)
-    cosphi = np.cos(latitude)
-    sinphi = np.sin(latitude)
+    # Compute quantities related to computation point. Each angle is converted
+    # to radians only once. These are array expressions, so the parallel
+    # version computes them in parallel too.
+    longitude_rad, latitude_rad = np.radians(longitude), np.radians(latitude)
+    coslambda, sinlambda = np.cos(longitude_rad), np.sin(longitude_rad)
+    cosphi, sinphi = np.cos(latitude_rad), np.sin(latitude_rad)
     # Compute quantities related to point masses
-    longitude_p = np.radians(longitude_p)
-    latitude_p = np.radians(latitude_p)
-    cosphi_p = np.cos(latitude_p)
-    sinphi_p = np.sin(latitude_p)
+    longitude_p_rad, latitude_p_rad = np.radians(longitude_p), np.radians(latitude_p)
+    coslambda_p, sinlambda_p = np.cos(longitude_p_rad), np.sin(longitude_p_rad)
+    cosphi_p, sinphi_p = np.cos(latitude_p_rad), np.sin(latitude_p_rad)
     # Compute gravitational field
     for l in prange(longitude.size):
+        coslambda_l, sinlambda_l = coslambda[l], sinlambda[l]
+        cosphi_l, sinphi_l, radius_l = cosphi[l], sinphi[l], radius[l]
+        result = 0.0
         for m in range(longitude_p.size):
-            out[l] += masses[m] * kernel(
-                longitude[l],
-                cosphi[l],
-                sinphi[l],
-                radius[l],
-                longitude_p[m],
+            result += masses[m] * kernel(
+                coslambda_l,
+                sinlambda_l,
+                cosphi_l,
+                sinphi_l,
+                radius_l,
+                coslambda_p[m],
+                sinlambda_p[m],
                 cosphi_p[m],
                 sinphi_p[m],
                 radius_p[m],
             )
+        out[l] += scale * result
 
 
 # Define jitted versions of the forward modelling functions
-point_mass_cartesian_serial = jit(nopython=True)(point_mass_cartesian)
-point_mass_cartesian_parallel = jit(nopython=True, parallel=True)(point_mass_cartesian)
-point_mass_spherical_serial = jit(nopython=True)(point_mass_spherical)
-point_mass_spherical_parallel = jit(nopython=True, parallel=True)(point_mass_spherical)
+point_mass_cartesian_serial = jit(
+    nopython=True, fastmath=FASTMATH, error_model="numpy"
+)(point_mass_cartesian)
+point_mass_cartesian_parallel = jit(
+    nopython=True, parallel=True, fastmath=FASTMATH, error_model="numpy"
+)(point_mass_cartesian)
+point_mass_spherical_serial = jit(
+    nopython=True, fastmath=FASTMATH, error_model="numpy"
+)(point_mass_spherical)
+point_mass_spherical_parallel = jit(
+    nopython=True, parallel=True, fastmath=FASTMATH, error_model="numpy"
+)(point_mass_spherical)
@@ -194,11 +194,13 @@ def prism_gravity(
     """
     if field not in FIELDS:
         raise ValueError("Gravitational field {} not recognized".format(field))
-    # Figure out the shape and size of the output array
-    cast = np.broadcast(*coordinates[:3])
-    result = np.zeros(cast.size, dtype=dtype)
+    # Broadcast the coordinates and figure out the shape and size of the
+    # output array
+    coordinates = np.broadcast_arrays(*coordinates[:3])
+    shape = coordinates[0].shape
+    result = np.zeros(coordinates[0].size, dtype=dtype)
     # Convert coordinates, prisms and density to arrays with proper shape
-    coordinates = tuple(np.atleast_1d(i).ravel() for i in coordinates[:3])
+    coordinates = tuple(np.ascontiguousarray(c).ravel() for c in coordinates)
     prisms = np.atleast_2d(prisms)
     density = np.atleast_1d(density).ravel()
     # Sanity checks
@@ -231,7 +233,7 @@ def prism_gravity(
     # Convert to more convenient units
     if field in ("g_ee", "g_nn", "g_zz", "g_en", "g_ez", "g_nz"):
         result *= 1e9  # SI to Eotvos
-    return result.reshape(cast.shape)
+    return result.reshape(shape)
 
 
 def _check_singular_points(coordinates, prisms, field):
@@ -554,8 +556,11 @@ def jit_prism_gravity(
     update_progressbar = progress_proxy is not None
     # Iterate over computation points and prisms
     for l in prange(easting.size):
+        # Accumulate the field of every prism in a local variable and write it
+        # to the output array only once per computation point
+        result = 0.0
         for m in range(prisms.shape[0]):
-            out[l] += forward_func(
+            result += forward_func(
                 easting[l],
                 northing[l],
                 upward[l],
@@ -567,6 +572,7 @@ def jit_prism_gravity(
                 prisms[m, 5],
                 density[m],
             )
+        out[l] += result
         # Update progress bar
         if update_progressbar:
             progress_proxy.update(1)
@@ -10,8 +10,8 @@ Define a layer of prisms
 import warnings
 
 import numpy as np
-import verde as vd
 import xarray as xr
+from numba import jit, prange
 
 from ..visualization import prism_to_pyvista
 from .prism_gravity import prism_gravity
@@ -116,26 +116,42 @@ def prism_layer(
     [3.75, 6.25, 1.0, 3.0, 0.0, 2.0]
     """  # noqa: W505
     dims = ("northing", "easting")
-    # Initialize data and data_names as None
-    data, data_names = None, None
-    # If properties were passed, then replace data_names and data for its keys
-    # and values, respectively
+    easting, northing = (np.asarray(c) for c in coordinates[:2])
+    # Get 1d coordinates out of 2d ones (like the ones returned by meshgrid)
+    if easting.ndim == 2:
+        _check_meshgrid(easting, northing)
+        easting, northing = easting[0, :], northing[:, 0]
+    _check_regular_grid(easting, northing)
+    # Build the data_vars for the properties, if any was passed
+    data_vars = None
     if properties:
-        data_names = tuple(p for p in properties.keys())
-        data = tuple(np.asarray(p) for p in properties.values())
-    # Create xr.Dataset for prisms
-    prisms = vd.make_xarray_grid(
-        coordinates, data=data, data_names=data_names, dims=dims
-    )
-    _check_regular_grid(prisms.easting.values, prisms.northing.values)
-    # Append some attributes to the xr.Dataset
+        data_vars = {
+            name: (dims, np.asarray(value)) for name, value in properties.items()
+        }
+    # Create xr.Dataset for prisms directly from the 1d coordinates
     attrs = {"coords_units": "meters", "properties_units": "SI"}
-    prisms.attrs = attrs
+    prisms = xr.Dataset(
+        data_vars, coords={"easting": easting, "northing": northing}, attrs=attrs
+    )
     # Create the top and bottom coordinates of the prisms
     prisms.prism_layer.update_top_bottom(surface, reference)
     return prisms
 
 
+def _check_meshgrid(easting, northing):
+    """
+    Check if the 2d easting and northing coordinates are meshgrids
+    """
+    if not (
+        np.allclose(easting[0, :], easting)
+        and np.allclose(northing[:, 0][:, np.newaxis], northing)
+    ):
+        raise ValueError(
+            "Invalid coordinate array. The arrays for the horizontal "
+            + "coordinates of a regular grid must be meshgrids."
+        )
+
+
 def _check_regular_grid(easting, northing):
     """
     Check if the easting and northing coordinates define a regular grid
@@ -144,10 +160,135 @@ def _check_regular_grid(easting, northing):
 
         This function should live inside Verde in the future
     """
-    if not np.allclose(easting[1] - easting[0], easting[1:] - easting[:-1]):
-        raise ValueError("Passed easting coordinates are not evenly spaced.")
-    if not np.allclose(northing[1] - northing[0], northing[1:] - northing[:-1]):
-        raise ValueError("Passed northing coordinates are not evenly spaced.")
+    for name, coordinate in zip(("easting", "northing"), (easting, northing)):
+        # The coordinates are evenly spaced if the largest and smallest steps
+        # are close to each other
+        steps = np.diff(coordinate)
+        if steps.size > 0 and not np.isclose(steps.max(), steps.min()):
+            raise ValueError(f"Passed {name} coordinates are not evenly spaced.")
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _fill_top_bottom(surface, reference, top, bottom):
+    """
+    Fill the top and bottom boundaries of the layer in a single pass
+
+    The ``top`` will be the greatest value between ``surface`` and
+    ``reference``, while ``bottom`` will be the lowest one. If ``surface`` is
+    a nan, ``top`` will be a nan and ``bottom`` will be the ``reference``.
+
+    Parameters
+    ----------
+    surface : 2d-array
+        Array with the uppermost boundary of the layer.
+    reference : 2d-array
+        Array with the lowermost boundary of the layer. Must have the same
+        shape as ``surface``.
+    top : 2d-array
+        Array where the top boundaries of the prisms will be stored. Must have
+        the same shape as ``surface``.
+    bottom : 2d-array
+        Array where the bottom boundaries of the prisms will be stored. Must
+        have the same shape as ``surface``.
+    """
+    n_north, n_east = surface.shape
+    for i in prange(n_north):
+        for j in range(n_east):
+            if surface[i, j] < reference[i, j]:
+                top[i, j] = reference[i, j]
+                bottom[i, j] = surface[i, j]
+            else:
+                top[i, j] = surface[i, j]
+                bottom[i, j] = reference[i, j]
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _fill_nonans_mask(top, bottom, prop, mask):
+    """
+    Fill a mask for prisms with no nans on top, bottom or a property
+
+    Parameters
+    ----------
+    top : 2d-array
+        Array with the top boundaries of the prisms.
+    bottom : 2d-array
+        Array with the bottom boundaries of the prisms. Must have the same
+        shape as ``top``.
+    prop : 2d-array
+        Array with the property of the prisms. Must have the same shape as
+        ``top``.
+    mask : 2d-array
+        Array of bools where the mask will be stored. Must have the same shape
+        as ``top``.
+
+    Returns
+    -------
+    n_missing : int
+        Number of prisms with no nans on their boundaries but a nan on their
+        property.
+    """
+    n_missing = 0
+    n_north, n_east = mask.shape
+    for i in prange(n_north):
+        for j in range(n_east):
+            if np.isnan(top[i, j]) or np.isnan(bottom[i, j]):
+                mask[i, j] = False
+            elif np.isnan(prop[i, j]):
+                mask[i, j] = False
+                n_missing += 1
+            else:
+                mask[i, j] = True
+    return n_missing
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def _fill_prisms(west, east, south, north, bottom, top, mask, prisms):
+    """
+    Fill the boundaries of the selected prisms of the layer in a single pass
+
+    Parameters
+    ----------
+    west, east : 1d-arrays
+        West and east boundaries of the prisms along the West-East direction.
+    south, north : 1d-arrays
+        South and north boundaries of the prisms along the South-North
+        direction.
+    bottom, top : 2d-arrays
+        Bottom and top boundaries of the prisms. Their shape must be
+        ``(south.size, west.size)``.
+    mask : 1d-array
+        Boolean array with the prisms that will be stored, raveled in the same
+        order as ``bottom`` and ``top``.
+    prisms : 2d-array
+        Array where the boundaries of the selected prisms will be stored, in
+        the following order: ``west``, ``east``, ``south``, ``north``,
+        ``bottom``, ``top``. Its shape must be ``(n_selected, 6)``, where
+        ``n_selected`` is the number of True elements in ``mask``.
+    """
+    n_north, n_east = bottom.shape
+    # Count the selected prisms on each row of the layer to find the index of
+    # the first one of each row in the prisms array
+    first = np.zeros(n_north + 1, dtype=np.int64)
+    for i in prange(n_north):
+        count = 0
+        for j in range(n_east):
+            if mask[i * n_east + j]:
+                count += 1
+        first[i + 1] = count
+    for i in range(n_north):
+        first[i + 1] += first[i]
+    for i in prange(n_north):
+        row = first[i]
+        for j in range(n_east):
+            if not mask[i * n_east + j]:
+                continue
+            prisms[row, 0] = west[j]
+            prisms[row, 1] = east[j]
+            prisms[row, 2] = south[i]
+            prisms[row, 3] = north[i]
+            prisms[row, 4] = bottom[i, j]
+            prisms[row, 5] = top[i, j]
+            row += 1
 
 
 @xr.register_dataset_accessor("prism_layer")
@@ -168,6 +309,14 @@ class DatasetAccessorPrismLayer:
 
     def __init__(self, xarray_obj):
         self._obj = xarray_obj
+        # Numpy arrays of the easting and northing coordinates of the layer,
+        # and the spacing and horizontal boundaries of the prisms derived from
+        # them, cached to avoid going through xarray on every access. They are
+        # cleared by _check_coordinates_cache if the coordinates are
+        # reassigned.
+        self._easting_index, self._northing_index = None, None
+        self._easting_np, self._northing_np = None, None
+        self._spacing, self._horizontal_boundaries = None, None
 
     @property
     def dims(self):
@@ -183,6 +332,9 @@ class DatasetAccessorPrismLayer:
         """
         Spacing between center of prisms
 
+        The spacing is computed (and the regular grid checked) only once for
+        the current coordinates of the layer.
+
         Returns
         -------
         s_north : float
@@ -190,10 +342,11 @@ class DatasetAccessorPrismLayer:
         s_east : float
             Spacing between center of prisms on the West-East direction.
         """
-        easting, northing = self._obj.easting.values, self._obj.northing.values
-        _check_regular_grid(easting, northing)
-        s_north, s_east = northing[1] - northing[0], easting[1] - easting[0]
-        return s_north, s_east
+        easting, northing = self._get_easting_northing()
+        if self._spacing is None:
+            _check_regular_grid(easting, northing)
+            self._spacing = (northing[1] - northing[0], easting[1] - easting[0])
+        return self._spacing
 
     @property
     def boundaries(self):
@@ -207,10 +360,11 @@ class DatasetAccessorPrismLayer:
             ``east``, ``south``, ``north``.
         """
         s_north, s_east = self.spacing
-        west = self._obj.easting.values.min() - s_east / 2
-        east = self._obj.easting.values.max() + s_east / 2
-        south = self._obj.northing.values.min() - s_north / 2
-        north = self._obj.northing.values.max() + s_north / 2
+        easting, northing = self._get_easting_northing()
+        west = easting.min() - s_east / 2
+        east = easting.max() + s_east / 2
+        south = northing.min() - s_north / 2
+        north = northing.max() + s_north / 2
         return west, east, south, north
 
     @property
@@ -223,7 +377,8 @@ class DatasetAccessorPrismLayer:
         size : int
             Total number of prisms in the layer.
         """
-        return self._obj.northing.size * self._obj.easting.size
+        easting, northing = self._get_easting_northing()
+        return northing.size * easting.size
 
     @property
     def shape(self):
@@ -237,25 +392,85 @@ class DatasetAccessorPrismLayer:
         n_east : int
             Number of prisms on the West-East direction.
         """
-        return (self._obj.northing.size, self._obj.easting.size)
+        easting, northing = self._get_easting_northing()
+        return (northing.size, easting.size)
+
+    def _check_coordinates_cache(self):
+        """
+        Clear the cached quantities if easting or northing were reassigned
+
+        Reassigning a coordinate of the Dataset replaces its index, so the
+        cache is keyed on the identity of the indexes of the coordinates.
+        """
+        indexes = self._obj.indexes
+        easting, northing = indexes["easting"], indexes["northing"]
+        if easting is not self._easting_index or northing is not self._northing_index:
+            self._easting_index, self._northing_index = easting, northing
+            self._easting_np, self._northing_np = None, None
+            self._spacing, self._horizontal_boundaries = None, None
+
+    def _get_easting_northing(self):
+        """
+        Return the easting and northing coordinates as numpy arrays
+        """
+        self._check_coordinates_cache()
+        if self._easting_np is None:
+            self._easting_np = self._obj.easting.values
+            self._northing_np = self._obj.northing.values
+        return self._easting_np, self._northing_np
+
+    def _get_top_bottom(self):
+        """
+        Return the top and bottom boundaries as numpy arrays
+        """
+        return self._obj.top.values, self._obj.bottom.values
+
+    def _get_horizontal_boundaries(self):
+        """
+        Horizontal boundaries of the prisms along each direction
+
+        The boundaries are computed only once for the current coordinates of
+        the layer.
+
+        Returns
+        -------
+        west, east : 1d-arrays
+            West and east boundaries of the prisms along the West-East
+            direction.
+        south, north : 1d-arrays
+            South and north boundaries of the prisms along the South-North
+            direction.
+        """
+        easting, northing = self._get_easting_northing()
+        if self._horizontal_boundaries is None:
+            s_north, s_east = self.spacing
+            half_east, half_north = s_east / 2, s_north / 2
+            self._horizontal_boundaries = (
+                easting - half_east,
+                easting + half_east,
+                northing - half_north,
+                northing + half_north,
+            )
+        return self._horizontal_boundaries
 
-    def _get_prism_horizontal_boundaries(self, easting, northing):
+    def _get_prism_horizontal_boundaries(self, index_northing, index_easting):
         """
-        Compute the horizontal boundaries of the prism
+        Return the horizontal boundaries of the prism
 
         Parameters
         ----------
-        easting : float or array
-            Easting coordinate of the center of the prism
-        northing : float or array
-            Northing coordinate of the center of the prism
-        """
-        spacing = self.spacing
-        west = easting - spacing[1] / 2
-        east = easting + spacing[1] / 2
-        south = northing - spacing[0] / 2
-        north = northing + spacing[0] / 2
-        return west, east, south, north
+        index_northing : int or array
+            Index of the prism along the South-North direction
+        index_easting : int or array
+            Index of the prism along the West-East direction
+        """
+        west, east, south, north = self._get_horizontal_boundaries()
+        return (
+            west[index_easting],
+            east[index_easting],
+            south[index_northing],
+            north[index_northing],
+        )
 
     def update_top_bottom(self, surface, reference):
         """
@@ -290,20 +505,26 @@ class DatasetAccessorPrismLayer:
                 + "Its shape should be compatible with the coordinates "
                 + "of the layer of prisms."
             )
-        if reference.ndim != 0:
-            if reference.shape != self.shape:
-                raise ValueError(
-                    f"Invalid reference array with shape '{reference.shape}'. "
-                    + "Its shape should be compatible with the coordinates "
-                    + "of the layer of prisms."
-                )
-        else:
-            reference = reference * np.ones(self.shape)
-        top = surface.copy()
-        bottom = reference.copy()
-        reverse = surface < reference
-        top[reverse] = reference[reverse]
-        bottom[reverse] = surface[reverse]
+        if reference.ndim != 0 and reference.shape != self.shape:
+            raise ValueError(
+                f"Invalid reference array with shape '{reference.shape}'. "
+                + "Its shape should be compatible with the coordinates "
+                + "of the layer of prisms."
+            )
+        # Keep the precision of the surface and reference on the boundaries,
+        # promoting integers to floats. A scalar reference is passed as
+        # a Python scalar so it doesn't upcast the surface.
+        dtype = np.result_type(
+            surface, reference.item() if reference.ndim == 0 else reference
+        )
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+        # Broadcast a scalar reference through a view instead of expanding it
+        # to a full array
+        reference = np.broadcast_to(reference, self.shape)
+        top = np.empty(self.shape, dtype=dtype)
+        bottom = np.empty(self.shape, dtype=dtype)
+        _fill_top_bottom(surface, reference, top, bottom)
         self._obj.coords["top"] = (self.dims, top)
         self._obj.coords["bottom"] = (self.dims, bottom)
 
@@ -367,22 +588,11 @@ class DatasetAccessorPrismLayer:
         --------
         harmonica.prism_gravity
         """
-        # Get boundaries and density of the prisms
-        boundaries = self._to_prisms()
-        density = self._obj[density_name].values
-        # Get the mask for selecting only the prisms whose top boundary, bottom
-        # boundary and density have no nans
-        mask = self._get_nonans_mask(property_name=density_name)
-        # Select only the boundaries and density elements for masked prisms
-        boundaries = boundaries[mask.ravel()]
-        density = density[mask]
-        # Discard thin prisms and their densities
-        if thickness_threshold is not None:
-            boundaries, density = _discard_thin_prisms(
-                boundaries,
-                density,
-                thickness_threshold,
-            )
+        # Get boundaries and density of the prisms with no nans and thicker
+        # than the threshold
+        boundaries, density = self._to_prisms_filtered(
+            density_name, thickness_threshold=thickness_threshold
+        )
         # Return gravity field of prisms
         return prism_gravity(
             coordinates,
@@ -411,29 +621,38 @@ class DatasetAccessorPrismLayer:
             no nans on top boundaries, bottom boundaries and the passed
             property.
         """
-        # Mask the prisms that contains no nans on top and bottom boundaries
-        mask = np.logical_and(
-            np.logical_not(np.isnan(self._obj.top.values)),
-            np.logical_not(np.isnan(self._obj.bottom.values)),
-        )
-        # Mask the prisms that contains nans on the selected property
-        if property_name is not None:
-            mask_property = np.logical_not(np.isnan(self._obj[property_name].values))
-            # Warn if a nan is found within the masked property
-            if not mask_property[mask].all():
-                warnings.warn(
-                    f"Found missing values in '{property_name}' property "
-                    + "of the prisms layer. The prisms with a nan as "
-                    + f"'{property_name}' will be ignored.",
-                    stacklevel=1,
-                )
-            mask = np.logical_and(mask, mask_property)
+        top, bottom = self._get_top_bottom()
+        # Use the top boundary as property if none is passed: its nans are
+        # masked anyway
+        if property_name is None:
+            prop = top
+        else:
+            prop = self._obj[property_name].values
+        mask = np.empty(self.shape, dtype=bool)
+        n_missing = _fill_nonans_mask(top, bottom, prop, mask)
+        # Warn if a nan is found in the property of prisms with no nans on
+        # their boundaries
+        if n_missing > 0:
+            warnings.warn(
+                f"Found missing values in '{property_name}' property "
+                + "of the prisms layer. The prisms with a nan as "
+                + f"'{property_name}' will be ignored.",
+                stacklevel=1,
+            )
         return mask
 
-    def _to_prisms(self):
+    def _to_prisms(self, mask=None):
         """
         Return the boundaries of each prism of the layer
 
+        Parameters
+        ----------
+        mask : 1d-array or None (optional)
+            Boolean array with the prisms that will be returned, raveled in
+            the same order as the ``top`` and ``bottom`` coordinates. Only the
+            boundaries of the selected prisms are computed. If None, every
+            prism of the layer is returned. Default to None.
+
         Returns
         -------
         prisms : 2d-array
@@ -442,17 +661,51 @@ class DatasetAccessorPrismLayer:
             order: ``west``, ``east``, ``south``, ``north``, ``bottom``,
             ``top``.
         """
-        easting, northing = np.meshgrid(
-            self._obj.easting.values, self._obj.northing.values
-        )
-        west, east, south, north = self._get_prism_horizontal_boundaries(
-            easting.ravel(), northing.ravel()
-        )
-        bottom = self._obj.bottom.values.ravel()
-        top = self._obj.top.values.ravel()
-        prisms = np.vstack((west, east, south, north, bottom, top)).T
+        if mask is None:
+            mask = np.ones(self.size, dtype=bool)
+        top, bottom = self._get_top_bottom()
+        west, east, south, north = self._get_horizontal_boundaries()
+        prisms = np.empty((np.count_nonzero(mask), 6), dtype=np.float64)
+        _fill_prisms(west, east, south, north, bottom, top, mask, prisms)
         return prisms
 
+    def _to_prisms_filtered(self, property_name, thickness_threshold=None):
+        """
+        Return the boundaries and property of the prisms to forward model
+
+        Only the prisms with no nans on their top and bottom boundaries and on
+        the passed property, and optionally thicker than a threshold, are
+        returned. A single mask is built for all these conditions, and only
+        the boundaries of the selected prisms are written to the output.
+
+        Parameters
+        ----------
+        property_name : str
+            Name of the property layer (or ``data_var`` of the
+            :class:`xarray.Dataset`) that will be returned along with the
+            boundaries of the prisms.
+        thickness_threshold : float or None (optional)
+            Prisms thinner than this threshold will be discarded. If None, no
+            prism will be discarded based on its thickness. Default to None.
+
+        Returns
+        -------
+        prisms : 2d-array
+            Array containing the boundaries of the selected prisms. Each row
+            contains the boundaries of each prism in the following order:
+            ``west``, ``east``, ``south``, ``north``, ``bottom``, ``top``.
+        prop : 1d-array
+            Array containing the property of the selected prisms.
+        """
+        mask = self._get_nonans_mask(property_name=property_name)
+        if thickness_threshold is not None:
+            top, bottom = self._get_top_bottom()
+            mask &= (top - bottom) >= thickness_threshold
+        mask = mask.ravel()
+        prisms = self._to_prisms(mask)
+        prop = np.compress(mask, self._obj[property_name].values.ravel())
+        return prisms, prop
+
     def get_prism(self, indices):
         """
         Return the boundaries of the chosen prism
@@ -469,16 +722,9 @@ class DatasetAccessorPrismLayer:
            Boundaries of the prisms in the following order:
            ``west``, ``east``, ``south``, ``north``, ``bottom``, ``top``.
         """
-        # Get the center of the prism
-        center_easting = self._obj.easting.values[indices[1]]
-        center_northing = self._obj.northing.values[indices[0]]
-        # Calculate the boundaries of the prism
-        west, east, south, north = self._get_prism_horizontal_boundaries(
-            center_easting, center_northing
-        )
-        bottom = self._obj.bottom.values[indices]
-        top = self._obj.top.values[indices]
-        return west, east, south, north, bottom, top
+        west, east, south, north = self._get_prism_horizontal_boundaries(*indices)
+        top, bottom = self._get_top_bottom()
+        return west, east, south, north, bottom[indices], top[indices]
 
     def to_pyvista(self, drop_null_prisms=True):
         """
@@ -515,42 +761,3 @@ class DatasetAccessorPrismLayer:
                 for data_var in self._obj.data_vars
             }
         return prism_to_pyvista(prisms, properties=properties)
-
-
-def _discard_thin_prisms(
-    prisms,
-    density,
-    thickness_threshold,
-):
-    """
-    Discard prisms with a thickness below a threshold
-
-    Parameters
-    ----------
-    prisms : 2d-array
-        Array containing the boundaries of the prisms in the following order:
-        ``w``, ``e``, ``s``, ``n``, ``bottom``, ``top``.
-        The array must have the following shape: (``n_prisms``, 6), where
-        ``n_prisms`` is the total number of prisms.
-    density : 1d-array
-        Array containing the density of each prism in kg/m^3. Must have the
-        same size as the number of prisms.
-    thickness_threshold : float
-        Prisms thinner than this threshold will be discarded.
-
-    Returns
-    -------
-    prisms : 2d-array
-        A copy of the ``prisms`` array that doesn't include the thin prisms.
-    density : 1d-array
-        A copy of the ``density`` array that doesn't include the density values
-        for thin prisms.
-    """
-    bottom, top = prisms[:, -2], prisms[:, -1]
-    # Mark prisms with thickness < threshold  as null prisms
-    thickness = top - bottom
-    null_prisms = thickness < thickness_threshold
-    # Keep only thick prisms and their densities
-    prisms = prisms[np.logical_not(null_prisms), :]
-    density = density[np.logical_not(null_prisms)]
-    return prisms, density
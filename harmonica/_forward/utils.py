@@ -18,6 +18,12 @@ try:
 except ImportError:
     ProgressBar = None
 
+# Floating point optimizations allowed on the jitted functions: fused
+# multiply-adds, reassociation and reciprocals. Unlike fastmath=True, these
+# don't assume that nans and infinities never show up (e.g. computation points
+# that fall on top of a point mass).
+FASTMATH = {"contract", "reassoc", "arcp"}
+
 
 def distance(point_p, point_q, coordinate_system="cartesian", ellipsoid=None):
     """
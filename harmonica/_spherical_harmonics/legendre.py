@@ -10,8 +10,15 @@ Calculation of associated Legendre functions and their derivatives.
 import numba
 import numpy as np
 
+from .._forward.utils import FASTMATH
 
-@numba.jit(nopython=True)
+# Reassociation is left out because the scaled functions are close to the top
+# of the float range and reordering the products of the recursive relations
+# can overflow them
+_FASTMATH = FASTMATH - {"reassoc"}
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
 def _rescale(u, max_degree, p):
     "Rescale Legendre functions to their original range"
     rescale = 1e280
@@ -22,7 +29,326 @@ def _rescale(u, max_degree, p):
             p[n, m] *= rescale
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _recurrence(x, max_degree, coefficients, p):
+    """
+    Run the recursive relations for the associated Legendre functions
+
+    Uses the Holmes and Featherstone (2002) scaling to compute scaled Pnm. The
+    coefficients of the recursive relations are given as a tuple ``(a, b, c,
+    d)`` of arrays, where ``a[n, m]`` and ``b[n, m]`` are the coefficients for
+    ``m < n - 1``, ``c[n]`` the ones for ``m = n - 1`` and ``d[n]`` the ones
+    for ``m = n``.
+    """
+    a, b, c, d = coefficients
+    u = np.sqrt((1 - x) * (1 + x))
+    # All terms are scaled by the max float range 1e280
+    p[0, 0] = 1e-280
+    for n in range(1, max_degree + 1):
+        for m in range(0, n - 1):
+            p[n, m] = a[n, m] * x * p[n - 1, m] + b[n, m] * p[n - 2, m]
+        p[n, n - 1] = c[n] * x * p[n - 1, n - 1]
+        # This equation doesn't have u because of the scaling
+        p[n, n] = d[n] * p[n - 1, n - 1]
+    # Now return everything to the original float range and rescale by u**m
+    _rescale(u, max_degree, p)
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _recurrence_packed(x, max_degree, coefficients, p):
+    """
+    Run the recursive relations storing the functions in a packed 1D array
+
+    Same as :func:`_recurrence` but ``p`` holds only the lower triangle of the
+    functions, indexed by :func:`packed_index`.
+    """
+    a, b, c, d = coefficients
+    u = np.sqrt((1 - x) * (1 + x))
+    # All terms are scaled by the max float range 1e280
+    p[0] = 1e-280
+    for n in range(1, max_degree + 1):
+        row = packed_index(n, 0)
+        previous = packed_index(n - 1, 0)
+        before_previous = packed_index(n - 2, 0)
+        for m in range(0, n - 1):
+            p[row + m] = (
+                a[n, m] * x * p[previous + m] + b[n, m] * p[before_previous + m]
+            )
+        p[row + n - 1] = c[n] * x * p[previous + n - 1]
+        # This equation doesn't have u because of the scaling
+        p[row + n] = d[n] * p[previous + n - 1]
+    # Now return everything to the original float range and rescale by u**m
+    rescale = np.empty(max_degree + 1)
+    rescale[0] = 1e280
+    for m in range(1, max_degree + 1):
+        rescale[m] = rescale[m - 1] * u
+    for n in range(0, max_degree + 1):
+        row = packed_index(n, 0)
+        for m in range(0, n + 1):
+            p[row + m] *= rescale[m]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _recurrence_with_derivative(
+    x, max_degree, p, dp, recurrence_row, derivative_row, coefficients
+):
+    """
+    Run the recursive relations and compute the derivatives in a single pass
+
+    Each row of scaled functions is computed by ``recurrence_row`` from the
+    two previous ones and rescaled as soon as it's computed, so the
+    derivatives of that degree can be calculated by ``derivative_row`` while
+    the row is still in cache. The scaled values of the two previous degrees
+    needed by the recursive relations are kept in separate buffers.
+    """
+    u = np.sqrt((1 - x) * (1 + x))
+    # Factors that return the functions to the original float range and
+    # rescale them by u**m
+    rescale = np.empty(max_degree + 1)
+    rescale[0] = 1e280
+    for m in range(1, max_degree + 1):
+        rescale[m] = rescale[m - 1] * u
+    sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
+    current = np.zeros(max_degree + 1)
+    previous = np.zeros(max_degree + 1)
+    before_previous = np.zeros(max_degree + 1)
+    # All terms are scaled by the max float range 1e280
+    current[0] = 1e-280
+    p[0, 0] = current[0] * rescale[0]
+    derivative_row(0, sqrt, p, dp)
+    for n in range(1, max_degree + 1):
+        before_previous, previous, current = previous, current, before_previous
+        recurrence_row(n, x, sqrt, coefficients, current, previous, before_previous)
+        for m in range(0, n + 1):
+            p[n, m] = current[m] * rescale[m]
+        derivative_row(n, sqrt, p, dp)
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _coefficients_row(n, x, sqrt, coefficients, current, previous, before_previous):
+    "Scaled functions of degree n using precomputed coefficients"
+    a, b, c, d = coefficients
+    for m in range(0, n - 1):
+        current[m] = a[n, m] * x * previous[m] + b[n, m] * before_previous[m]
+    current[n - 1] = c[n] * x * previous[n - 1]
+    # This equation doesn't have u because of the scaling
+    current[n] = d[n] * previous[n - 1]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _unnormalized_row(n, x, sqrt, coefficients, current, previous, before_previous):
+    "Scaled unnormalized functions of degree n"
+    for m in range(0, n - 1):
+        a_nm = (2 * n - 1) / (n - m)
+        b_nm = -(n + m - 1) / (n - m)
+        current[m] = a_nm * x * previous[m] + b_nm * before_previous[m]
+    current[n - 1] = (2 * n - 1) * x * previous[n - 1]
+    # This equation doesn't have u because of the scaling
+    current[n] = (2 * n - 1) * previous[n - 1]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _schmidt_row(n, x, sqrt, coefficients, current, previous, before_previous):
+    "Scaled Schmidt normalized functions of degree n"
+    for m in range(0, n - 1):
+        inverse = 1 / (sqrt[n + m] * sqrt[n - m])
+        a_nm = (2 * n - 1) * inverse
+        b_nm = -sqrt[n + m - 1] * sqrt[n - m - 1] * inverse
+        current[m] = a_nm * x * previous[m] + b_nm * before_previous[m]
+    current[n - 1] = sqrt[2 * n - 1] * x * previous[n - 1]
+    # This equation doesn't have u because of the scaling
+    if n == 1:
+        current[n] = previous[n - 1]
+    else:
+        current[n] = sqrt[2 * n - 1] / sqrt[2 * n] * previous[n - 1]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _full_row(n, x, sqrt, coefficients, current, previous, before_previous):
+    "Scaled fully normalized functions of degree n"
+    # Factors that depend only on the degree (the loop over the orders is
+    # empty for n = 1)
+    a_n = sqrt[2 * n + 1] * sqrt[2 * n - 1]
+    b_n = -sqrt[2 * n + 1] / sqrt[max(2 * n - 3, 1)]
+    for m in range(0, n - 1):
+        inverse = 1 / (sqrt[n + m] * sqrt[n - m])
+        a_nm = a_n * inverse
+        b_nm = b_n * sqrt[n + m - 1] * sqrt[n - m - 1] * inverse
+        current[m] = a_nm * x * previous[m] + b_nm * before_previous[m]
+    current[n - 1] = sqrt[2 * n + 1] * x * previous[n - 1]
+    # This equation doesn't have u because of the scaling
+    if n == 1:
+        current[n] = sqrt[3] * previous[n - 1]
+    else:
+        current[n] = sqrt[2 * n + 1] / sqrt[2 * n] * previous[n - 1]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _derivative_row(n, sqrt, p, dp):
+    "Derivatives of degree n of the unnormalized functions"
+    if n == 0:
+        dp[0, 0] = 0
+        return
+    a_nm = -1
+    dp[n, 0] = a_nm * p[n, 1]
+    for m in range(1, n):
+        b_nm = 0.5 * (n + m) * (n - m + 1)
+        c_nm = -0.5
+        dp[n, m] = b_nm * p[n, m - 1] + c_nm * p[n, m + 1]
+    d_nm = n
+    dp[n, n] = d_nm * p[n, n - 1]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _normalized_derivative_row(n, sqrt, p, dp):
+    "Derivatives of degree n of the Schmidt or fully normalized functions"
+    if n == 0:
+        dp[0, 0] = 0
+        return
+    if n == 1:
+        dp[1, 0] = -p[1, 1]
+        dp[1, 1] = p[1, 0]
+        return
+    a_nm = -sqrt[n] * sqrt[n + 1] / sqrt[2]
+    dp[n, 0] = a_nm * p[n, 1]
+    b_n1 = 0.5 * sqrt[2] * sqrt[n + 1] * sqrt[n]
+    c_n1 = -0.5 * sqrt[n + 2] * sqrt[n - 1]
+    dp[n, 1] = b_n1 * p[n, 0] + c_n1 * p[n, 2]
+    for m in range(2, n):
+        b_nm = 0.5 * sqrt[n + m] * sqrt[n - m + 1]
+        c_nm = -0.5 * sqrt[n + m + 1] * sqrt[n - m]
+        dp[n, m] = b_nm * p[n, m - 1] + c_nm * p[n, m + 1]
+    d_nm = 0.5 * sqrt[2] * sqrt[n]
+    dp[n, n] = d_nm * p[n, n - 1]
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def packed_index(n, m):
+    """
+    Index of the function of degree n and order m in a packed array.
+
+    Packed arrays store only the lower triangle (``m <= n``) of the associated
+    Legendre functions, row after row.
+
+    Parameters
+    ----------
+    n : int
+        The degree of the function.
+    m : int
+        The order of the function. Must be smaller or equal than ``n``.
+
+    Returns
+    -------
+    index : int
+        The index of the function in the packed array.
+    """
+    return n * (n + 1) // 2 + m
+
+
+def packed_to_dense(p, max_degree):
+    """
+    Unpack associated Legendre functions stored in a packed array.
+
+    Parameters
+    ----------
+    p : numpy.ndarray
+        Array with the functions packed as described in :func:`packed_index`
+        along its last dimension, which must have
+        ``(max_degree + 1) * (max_degree + 2) // 2`` elements.
+    max_degree : int
+        The maximum degree of the functions.
+
+    Returns
+    -------
+    dense : numpy.ndarray
+        Array with the functions in its two last dimensions, with shape
+        ``(..., max_degree + 1, max_degree + 1)``. Elements with ``m > n`` are
+        set to zero.
+    """
+    p = np.asarray(p)
+    dense = np.zeros(p.shape[:-1] + (max_degree + 1, max_degree + 1))
+    degree, order = np.tril_indices(max_degree + 1)
+    dense[..., degree, order] = p
+    return dense
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_schmidt_coefficients(max_degree):
+    """
+    Coefficients of the recursive relations of Schmidt normalized functions.
+
+    The coefficients don't depend on the argument of the functions, so they
+    can be computed once and passed to :func:`associated_legendre_schmidt`
+    when evaluating the functions for several values of :math:`x`.
+
+    Parameters
+    ----------
+    max_degree : int
+        The maximum degree for the calculation.
+
+    Returns
+    -------
+    coefficients : tuple of arrays
+        The ``(a, b, c, d)`` coefficients of the recursive relations.
+    """
+    # Pre-compute square roots of integers used in the loops
+    sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
+    a = np.zeros((max_degree + 1, max_degree + 1))
+    b = np.zeros((max_degree + 1, max_degree + 1))
+    c = np.zeros(max_degree + 1)
+    d = np.zeros(max_degree + 1)
+    for n in range(1, max_degree + 1):
+        for m in range(0, n - 1):
+            inverse = 1 / (sqrt[n + m] * sqrt[n - m])
+            a[n, m] = (2 * n - 1) * inverse
+            b[n, m] = -sqrt[n + m - 1] * sqrt[n - m - 1] * inverse
+        c[n] = sqrt[2 * n - 1]
+        d[n] = sqrt[2 * n - 1] / sqrt[2 * n]
+    d[1] = 1
+    return a, b, c, d
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_full_coefficients(max_degree):
+    """
+    Coefficients of the recursive relations of fully normalized functions.
+
+    The coefficients don't depend on the argument of the functions, so they
+    can be computed once and passed to :func:`associated_legendre_full` when
+    evaluating the functions for several values of :math:`x`.
+
+    Parameters
+    ----------
+    max_degree : int
+        The maximum degree for the calculation.
+
+    Returns
+    -------
+    coefficients : tuple of arrays
+        The ``(a, b, c, d)`` coefficients of the recursive relations.
+    """
+    # Pre-compute square roots of integers used in the loops
+    sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
+    a = np.zeros((max_degree + 1, max_degree + 1))
+    b = np.zeros((max_degree + 1, max_degree + 1))
+    c = np.zeros(max_degree + 1)
+    d = np.zeros(max_degree + 1)
+    for n in range(1, max_degree + 1):
+        # Factors that depend only on the degree (the loop over the orders is
+        # empty for n = 1)
+        a_n = sqrt[2 * n + 1] * sqrt[2 * n - 1]
+        b_n = -sqrt[2 * n + 1] / sqrt[max(2 * n - 3, 1)]
+        for m in range(0, n - 1):
+            inverse = 1 / (sqrt[n + m] * sqrt[n - m])
+            a[n, m] = a_n * inverse
+            b[n, m] = b_n * sqrt[n + m - 1] * sqrt[n - m - 1] * inverse
+        c[n] = sqrt[2 * n + 1]
+        d[n] = sqrt[2 * n + 1] / sqrt[2 * n]
+    d[1] = sqrt[3]
+    return a, b, c, d
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
 def associated_legendre(x, max_degree, p):
     """
     Unnormalized associated Legendre functions up to a maximum degree.
@@ -70,7 +396,7 @@ def associated_legendre(x, max_degree, p):
         p[n, n] = d_nm * u * p[n - 1, n - 1]
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
 def associated_legendre_derivative(max_degree, p, dp):
     """
     Derivatives in theta of unnormalized associated Legendre functions.
@@ -113,20 +439,40 @@ def associated_legendre_derivative(max_degree, p, dp):
       Implementation of associated Legendre functions in GSL.
       https://www.gnu.org/software/gsl/tr/tr001.pdf
     """
-    dp[0, 0] = 0
-    for n in range(1, max_degree + 1):
-        a_nm = -1
-        dp[n, 0] = a_nm * p[n, 1]
-        for m in range(1, n):
-            b_nm = 0.5 * (n + m) * (n - m + 1)
-            c_nm = -0.5
-            dp[n, m] = b_nm * p[n, m - 1] + c_nm * p[n, m + 1]
-        d_nm = n
-        dp[n, n] = d_nm * p[n, n - 1]
+    for n in range(0, max_degree + 1):
+        _derivative_row(n, None, p, dp)
 
 
-@numba.jit(nopython=True)
-def associated_legendre_schmidt(x, max_degree, p):
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_with_derivative(x, max_degree, p, dp):
+    """
+    Unnormalized associated Legendre functions and their derivatives.
+
+    Equivalent to calling :func:`associated_legendre` followed by
+    :func:`associated_legendre_derivative`, but the derivatives of each
+    degree are computed right after the functions of that degree, so ``p`` is
+    traversed only once.
+
+    Parameters
+    ----------
+    x : float
+        The argument of :math:`P_n^m(x)`. Must be in the range [-1, 1].
+    max_degree : int
+        The maximum degree for the calculation.
+    p : numpy.array
+        A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
+        filled with the values of the functions.
+    dp : numpy.array
+        A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
+        filled with the values of the derivatives.
+    """
+    _recurrence_with_derivative(
+        x, max_degree, p, dp, _unnormalized_row, _derivative_row, None
+    )
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_schmidt(x, max_degree, p, coefficients=None):
     """
     Schmidt normalized associated Legendre functions up to maximum degree.
 
@@ -154,6 +500,12 @@ def associated_legendre_schmidt(x, max_degree, p):
     p : numpy.array
         A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
         filled with the output values.
+    coefficients : tuple of arrays or None
+        The coefficients of the recursive relations, as returned by
+        :func:`associated_legendre_schmidt_coefficients`.
+        If None, they will be computed along the recursion. Pass them when
+        evaluating the functions for many values of :math:`x` to avoid
+        recomputing them on every call. Default None.
 
     References
     ----------
@@ -162,6 +514,9 @@ def associated_legendre_schmidt(x, max_degree, p):
       Implementation of associated Legendre functions in GSL.
       https://www.gnu.org/software/gsl/tr/tr001.pdf
     """
+    if coefficients is not None:
+        _recurrence(x, max_degree, coefficients, p)
+        return
     u = np.sqrt((1 - x) * (1 + x))
     # Pre-compute square roots of integers used in the loops
     sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
@@ -179,8 +534,9 @@ def associated_legendre_schmidt(x, max_degree, p):
     # Now calculate the other terms
     for n in range(2, max_degree + 1):
         for m in range(1, n - 1):
-            a_nm = (2 * n - 1) / (sqrt[n + m] * sqrt[n - m])
-            b_nm = -sqrt[n + m - 1] * sqrt[n - m - 1] / (sqrt[n + m] * sqrt[n - m])
+            inverse = 1 / (sqrt[n + m] * sqrt[n - m])
+            a_nm = (2 * n - 1) * inverse
+            b_nm = -sqrt[n + m - 1] * sqrt[n - m - 1] * inverse
             p[n, m] = a_nm * x * p[n - 1, m] + b_nm * p[n - 2, m]
         c_nm = sqrt[2 * n - 1]
         p[n, n - 1] = c_nm * x * p[n - 1, n - 1]
@@ -191,7 +547,165 @@ def associated_legendre_schmidt(x, max_degree, p):
     _rescale(u, max_degree, p)
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, parallel=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_schmidt_many(x, max_degree, p, coefficients=None):
+    """
+    Schmidt normalized associated Legendre functions for several arguments.
+
+    Equivalent to calling :func:`associated_legendre_schmidt` for every
+    element of ``x``, but the coefficients of the recursive relations are
+    computed only once and the arguments are evaluated in parallel.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A 1D array with the arguments of :math:`P_n^m(x)`. Must be in the
+        range [-1, 1].
+    max_degree : int
+        The maximum degree for the calculation.
+    p : numpy.array
+        A 2D array with shape
+        ``(x.size, (max_degree + 1) * (max_degree + 2) // 2)`` that will be
+        filled with the output values. ``p[i]`` holds the functions
+        calculated for ``x[i]`` packed in a lower triangular layout: the
+        function of degree ``n`` and order ``m`` is stored in
+        ``p[i, packed_index(n, m)]``. Use :func:`packed_to_dense` to unpack
+        them.
+    coefficients : tuple of arrays or None
+        The coefficients of the recursive relations, as returned by
+        :func:`associated_legendre_schmidt_coefficients`.
+        If None, they will be computed. Default None.
+    """
+    if coefficients is None:
+        coefficients = associated_legendre_schmidt_coefficients(max_degree)
+    for i in numba.prange(x.size):
+        _recurrence_packed(x[i], max_degree, coefficients, p[i])
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def _schmidt_coefficients_of_order(max_degree, order):
+    """
+    Coefficients of the recursive relations of Schmidt normalized functions
+    for a single order
+
+    Same as :func:`associated_legendre_schmidt_coefficients` but ``a`` and
+    ``b`` are 1D arrays with the coefficients of the given order for each
+    degree.
+    """
+    # Pre-compute square roots of integers used in the loops
+    sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
+    a = np.zeros(max_degree + 1)
+    b = np.zeros(max_degree + 1)
+    c = np.zeros(max_degree + 1)
+    d = np.zeros(max_degree + 1)
+    for n in range(order + 2, max_degree + 1):
+        inverse = 1 / (sqrt[n + order] * sqrt[n - order])
+        a[n] = (2 * n - 1) * inverse
+        b[n] = -sqrt[n + order - 1] * sqrt[n - order - 1] * inverse
+    for n in range(1, max_degree + 1):
+        c[n] = sqrt[2 * n - 1]
+        d[n] = sqrt[2 * n - 1] / sqrt[2 * n]
+    d[1] = 1
+    return a, b, c, d
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_schmidt_clenshaw(
+    x, max_degree, order, weights, coefficients=None
+):
+    r"""
+    Weighted sum over degrees of Schmidt normalized Legendre functions.
+
+    Calculates
+
+    .. math::
+
+        S = \sum_{n=m}^{N} w_n P_n^m(x)
+
+    for a single order :math:`m` using the Clenshaw algorithm, which runs the
+    recursive relations backwards over the degrees. The functions
+    :math:`P_n^m` are never stored, so there is no need to fill the
+    ``(max_degree + 1, max_degree + 1)`` array required by
+    :func:`associated_legendre_schmidt` just to reduce it afterwards.
+
+    .. note::
+
+        This function does not include the Condon-Shortly phase.
+
+    .. note::
+
+        This function uses the scaling scheme of Holmes and Featherstone (2002)
+        so the sums don't overflow for high degrees near the poles.
+
+    Parameters
+    ----------
+    x : float
+        The argument of :math:`P_n^m(x)`. Must be in the range [-1, 1].
+    max_degree : int
+        The maximum degree :math:`N` of the sum.
+    order : int
+        The order :math:`m` of the functions.
+    weights : numpy.ndarray
+        A 1D array with ``max_degree + 1`` elements with the weight
+        :math:`w_n` of each degree. Elements for degrees smaller than
+        ``order`` are ignored.
+    coefficients : tuple of arrays or None
+        The coefficients of the recursive relations, as returned by
+        :func:`associated_legendre_schmidt_coefficients`.
+        If None, only the ones for the given order will be computed.
+        Default None.
+
+    Returns
+    -------
+    result : float
+        The weighted sum of the functions.
+
+    References
+    ----------
+
+    Clenshaw, C. W. (1955). A note on the summation of Chebyshev series.
+      Mathematics of Computation, 9(51), 118-120.
+      https://doi.org/10.1090/S0025-5718-1955-0071856-0
+    """
+    if coefficients is None:
+        a, b, c, d = _schmidt_coefficients_of_order(max_degree, order)
+    else:
+        a, b, c, d = coefficients
+        a, b = a[:, order], b[:, order]
+    u = np.sqrt((1 - x) * (1 + x))
+    # Use the Holmes and Featherstone (2002) scaling: the weights are scaled
+    # by 1e-280 so the backward sums don't overflow for high degrees near the
+    # poles, where the functions divided by u**m become very large.
+    # Run the recursive relations backwards from max_degree down to order + 1.
+    # Terms with degrees above max_degree are zero, so the first two steps
+    # are done separately to avoid reading coefficients out of range.
+    b_next, b_next2 = 0.0, 0.0
+    if max_degree > order:
+        b_next = weights[max_degree] * 1e-280
+    if max_degree - 1 > order:
+        b_next2 = b_next
+        b_next = weights[max_degree - 1] * 1e-280 + a[max_degree] * x * b_next2
+    for n in range(max_degree - 2, order, -1):
+        b_n = weights[n] * 1e-280 + a[n + 1] * x * b_next + b[n + 2] * b_next2
+        b_next2 = b_next
+        b_next = b_n
+    # Combine with the first two terms of the forward recursion: P_{m+1}^m is
+    # c * x * P_m^m and the rest follow the a, b relations
+    result = weights[order] * 1e-280
+    if order + 1 <= max_degree:
+        result += c[order + 1] * x * b_next
+    if order + 2 <= max_degree:
+        result += b[order + 2] * b_next2
+    # Multiply by the diagonal term P_m^m and return to the original float
+    # range. The factor is built first so the product of the large scaled sum
+    # and the small u**m doesn't overflow.
+    rescale = 1e280
+    for k in range(1, order + 1):
+        rescale *= d[k] * u
+    return result * rescale
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
 def associated_legendre_schmidt_derivative(max_degree, p, dp):
     """
     Derivatives in theta of Schmidt normalized associated Legendre functions.
@@ -237,25 +751,57 @@ def associated_legendre_schmidt_derivative(max_degree, p, dp):
     """
     # Pre-compute square roots of integers used in the loops
     sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
-    dp[0, 0] = 0
-    dp[1, 0] = -p[1, 1]
-    dp[1, 1] = p[1, 0]
-    for n in range(2, max_degree + 1):
-        a_nm = -sqrt[n] * sqrt[n + 1] / sqrt[2]
-        dp[n, 0] = a_nm * p[n, 1]
-        b_nm = 0.5 * sqrt[n] * sqrt[n + 1] * sqrt[2]
-        c_nm = -0.5 * sqrt[n + 2] * sqrt[n - 1]
-        dp[n, 1] = b_nm * p[n, 0] + c_nm * p[n, 2]
-        for m in range(2, n):
-            b_nm = 0.5 * sqrt[n + m] * sqrt[n - m + 1]
-            c_nm = -0.5 * sqrt[n + m + 1] * sqrt[n - m]
-            dp[n, m] = b_nm * p[n, m - 1] + c_nm * p[n, m + 1]
-        d_nm = 0.5 * sqrt[2] * sqrt[n]
-        dp[n, n] = d_nm * p[n, n - 1]
-
-
-@numba.jit(nopython=True)
-def associated_legendre_full(x, max_degree, p):
+    for n in range(0, max_degree + 1):
+        _normalized_derivative_row(n, sqrt, p, dp)
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_schmidt_with_derivative(
+    x, max_degree, p, dp, coefficients=None
+):
+    """
+    Schmidt normalized associated Legendre functions and their derivatives.
+
+    Equivalent to calling :func:`associated_legendre_schmidt` followed by
+    :func:`associated_legendre_schmidt_derivative`, but the derivatives of each
+    degree are computed right after the functions of that degree, so ``p`` is
+    traversed only once.
+
+    Parameters
+    ----------
+    x : float
+        The argument of :math:`P_n^m(x)`. Must be in the range [-1, 1].
+    max_degree : int
+        The maximum degree for the calculation.
+    p : numpy.array
+        A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
+        filled with the values of the functions.
+    dp : numpy.array
+        A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
+        filled with the values of the derivatives.
+    coefficients : tuple of arrays or None
+        The coefficients of the recursive relations, as returned by
+        :func:`associated_legendre_schmidt_coefficients`.
+        If None, they will be computed along the recursion. Default None.
+    """
+    if coefficients is None:
+        _recurrence_with_derivative(
+            x, max_degree, p, dp, _schmidt_row, _normalized_derivative_row, None
+        )
+    else:
+        _recurrence_with_derivative(
+            x,
+            max_degree,
+            p,
+            dp,
+            _coefficients_row,
+            _normalized_derivative_row,
+            coefficients,
+        )
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_full(x, max_degree, p, coefficients=None):
     """
     Fully normalized associated Legendre functions up to maximum degree.
 
@@ -279,6 +825,12 @@ def associated_legendre_full(x, max_degree, p):
     p : numpy.array
         A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
         filled with the output values.
+    coefficients : tuple of arrays or None
+        The coefficients of the recursive relations, as returned by
+        :func:`associated_legendre_full_coefficients`.
+        If None, they will be computed along the recursion. Pass them when
+        evaluating the functions for many values of :math:`x` to avoid
+        recomputing them on every call. Default None.
 
     References
     ----------
@@ -289,6 +841,9 @@ def associated_legendre_full(x, max_degree, p):
     Hofmann-Wellenhof, B., & Moritz, H. (2006). Physical Geodesy (2nd, corr.
       ed. 2006 edition ed.). Wien ; New York: Springer.
     """
+    if coefficients is not None:
+        _recurrence(x, max_degree, coefficients, p)
+        return
     u = np.sqrt((1 - x) * (1 + x))
     # Pre-compute square roots of integers used in the loops
     sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
@@ -305,14 +860,13 @@ def associated_legendre_full(x, max_degree, p):
         p[n, 0] = a_n0 * x * p[n - 1, 0] + b_n0 * p[n - 2, 0]
     # Now calculate the other terms
     for n in range(2, max_degree + 1):
+        # Factors that depend only on the degree
+        a_n = sqrt[2 * n + 1] * sqrt[2 * n - 1]
+        b_n = -sqrt[2 * n + 1] / sqrt[2 * n - 3]
         for m in range(1, n - 1):
-            a_nm = sqrt[2 * n + 1] * sqrt[2 * n - 1] / (sqrt[n + m] * sqrt[n - m])
-            b_nm = (
-                -sqrt[n + m - 1]
-                * sqrt[n - m - 1]
-                * sqrt[2 * n + 1]
-                / (sqrt[n + m] * sqrt[n - m] * sqrt[2 * n - 3])
-            )
+            inverse = 1 / (sqrt[n + m] * sqrt[n - m])
+            a_nm = a_n * inverse
+            b_nm = b_n * sqrt[n + m - 1] * sqrt[n - m - 1] * inverse
             p[n, m] = a_nm * x * p[n - 1, m] + b_nm * p[n - 2, m]
         c_nm = sqrt[2 * n + 1]
         p[n, n - 1] = c_nm * x * p[n - 1, n - 1]
@@ -323,7 +877,7 @@ def associated_legendre_full(x, max_degree, p):
     _rescale(u, max_degree, p)
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
 def associated_legendre_full_derivative(max_degree, p, dp):
     """
     Derivatives in theta of fully normalized associated Legendre functions.
@@ -366,18 +920,48 @@ def associated_legendre_full_derivative(max_degree, p, dp):
     """
     # Pre-compute square roots of integers used in the loops
     sqrt = np.sqrt(np.arange(2 * (max_degree + 1)))
-    dp[0, 0] = 0
-    dp[1, 0] = -p[1, 1]
-    dp[1, 1] = p[1, 0]
-    for n in range(2, max_degree + 1):
-        a_nm = -sqrt[n] * sqrt[n + 1] / sqrt[2]
-        dp[n, 0] = a_nm * p[n, 1]
-        b_n1 = 0.5 * sqrt[2] * sqrt[n + 1] * sqrt[n]
-        c_n1 = -0.5 * sqrt[n + 2] * sqrt[n - 1]
-        dp[n, 1] = b_n1 * p[n, 0] + c_n1 * p[n, 2]
-        for m in range(2, n):
-            b_nm = 0.5 * sqrt[n + m] * sqrt[n - m + 1]
-            c_nm = -0.5 * sqrt[n + m + 1] * sqrt[n - m]
-            dp[n, m] = b_nm * p[n, m - 1] + c_nm * p[n, m + 1]
-        d_nm = 0.5 * sqrt[2] * sqrt[n]
-        dp[n, n] = d_nm * p[n, n - 1]
+    for n in range(0, max_degree + 1):
+        _normalized_derivative_row(n, sqrt, p, dp)
+
+
+@numba.jit(nopython=True, fastmath=_FASTMATH, error_model="numpy")
+def associated_legendre_full_with_derivative(x, max_degree, p, dp, coefficients=None):
+    """
+    Fully normalized associated Legendre functions and their derivatives.
+
+    Equivalent to calling :func:`associated_legendre_full` followed by
+    :func:`associated_legendre_full_derivative`, but the derivatives of each
+    degree are computed right after the functions of that degree, so ``p`` is
+    traversed only once.
+
+    Parameters
+    ----------
+    x : float
+        The argument of :math:`P_n^m(x)`. Must be in the range [-1, 1].
+    max_degree : int
+        The maximum degree for the calculation.
+    p : numpy.array
+        A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
+        filled with the values of the functions.
+    dp : numpy.array
+        A 2D array with shape ``(max_degree + 1, max_degree + 1)`` that will be
+        filled with the values of the derivatives.
+    coefficients : tuple of arrays or None
+        The coefficients of the recursive relations, as returned by
+        :func:`associated_legendre_full_coefficients`.
+        If None, they will be computed along the recursion. Default None.
+    """
+    if coefficients is None:
+        _recurrence_with_derivative(
+            x, max_degree, p, dp, _full_row, _normalized_derivative_row, None
+        )
+    else:
+        _recurrence_with_derivative(
+            x,
+            max_degree,
+            p,
+            dp,
+            _coefficients_row,
+            _normalized_derivative_row,
+            coefficients,
+        )
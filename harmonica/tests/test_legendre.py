@@ -16,9 +16,18 @@ from .._spherical_harmonics.legendre import (
     associated_legendre,
     associated_legendre_derivative,
     associated_legendre_full,
+    associated_legendre_full_coefficients,
     associated_legendre_full_derivative,
+    associated_legendre_full_with_derivative,
     associated_legendre_schmidt,
+    associated_legendre_schmidt_clenshaw,
+    associated_legendre_schmidt_coefficients,
     associated_legendre_schmidt_derivative,
+    associated_legendre_schmidt_many,
+    associated_legendre_schmidt_with_derivative,
+    associated_legendre_with_derivative,
+    packed_index,
+    packed_to_dense,
 )
 from .utils import run_only_with_numba
 
@@ -122,6 +131,87 @@ def test_associated_legendre_function_analytical(func, norm):
                 np.testing.assert_allclose(p_analytical[n, m], p[n, m], atol=1e-10)
 
 
+@pytest.mark.use_numba
+@pytest.mark.parametrize(
+    "func,coefs",
+    (
+        (associated_legendre_schmidt, associated_legendre_schmidt_coefficients),
+        (associated_legendre_full, associated_legendre_full_coefficients),
+    ),
+    ids=["schmidt", "full"],
+)
+def test_associated_legendre_function_precomputed_coefficients(func, coefs):
+    "Check that passing precomputed coefficients gives the same results"
+    max_degree = 10
+    coefficients = coefs(max_degree)
+    p = np.empty((max_degree + 1, max_degree + 1))
+    p_precomputed = np.empty((max_degree + 1, max_degree + 1))
+    for x in np.linspace(-1, 1, 50):
+        func(x, max_degree, p)
+        func(x, max_degree, p_precomputed, coefficients)
+        np.testing.assert_allclose(
+            np.tril(p_precomputed), np.tril(p), rtol=1e-10, atol=1e-10
+        )
+
+
+@pytest.mark.use_numba
+def test_associated_legendre_schmidt_many():
+    "Check that evaluating several arguments matches the single version"
+    max_degree = 20
+    x = np.linspace(-1, 1, 31)
+    p_many = np.zeros((x.size, (max_degree + 1) * (max_degree + 2) // 2))
+    associated_legendre_schmidt_many(x, max_degree, p_many)
+    p_many = packed_to_dense(p_many, max_degree)
+    p = np.zeros((max_degree + 1, max_degree + 1))
+    for i in range(x.size):
+        associated_legendre_schmidt(x[i], max_degree, p)
+        np.testing.assert_allclose(p_many[i], p, rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.use_numba
+@pytest.mark.parametrize("order", (0, 1, 5, 19, 20))
+def test_associated_legendre_schmidt_clenshaw(order):
+    "Check the Clenshaw summation against summing the functions directly"
+    max_degree = 20
+    weights = np.random.default_rng(seed=42).normal(size=max_degree + 1)
+    p = np.zeros((max_degree + 1, max_degree + 1))
+    for x in np.linspace(-1, 1, 31):
+        associated_legendre_schmidt(x, max_degree, p)
+        expected = (weights[order:] * p[order:, order]).sum()
+        result = associated_legendre_schmidt_clenshaw(x, max_degree, order, weights)
+        np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+
+
+@run_only_with_numba
+@pytest.mark.parametrize("x", (-0.999, 0.999))
+def test_associated_legendre_schmidt_clenshaw_high_degree(x):
+    "Check the Clenshaw summation doesn't overflow for high degrees"
+    max_degree = 2700
+    weights = np.random.default_rng(seed=42).normal(size=max_degree + 1)
+    p = np.zeros((max_degree + 1, max_degree + 1))
+    associated_legendre_schmidt(x, max_degree, p)
+    coefficients = associated_legendre_schmidt_coefficients(max_degree)
+    for order in range(0, max_degree + 1, 100):
+        expected = (weights[order:] * p[order:, order]).sum()
+        result = associated_legendre_schmidt_clenshaw(x, max_degree, order, weights)
+        np.testing.assert_allclose(result, expected, rtol=1e-8, atol=1e-10)
+        result = associated_legendre_schmidt_clenshaw(
+            x, max_degree, order, weights, coefficients
+        )
+        np.testing.assert_allclose(result, expected, rtol=1e-8, atol=1e-10)
+
+
+def test_packed_index():
+    "Check the indices of the packed lower triangular layout"
+    max_degree = 5
+    packed = np.arange((max_degree + 1) * (max_degree + 2) // 2)
+    dense = packed_to_dense(packed, max_degree)
+    for n in range(max_degree + 1):
+        for m in range(n + 1):
+            assert dense[n, m] == packed[packed_index(n, m)]
+    np.testing.assert_array_equal(np.triu(dense, k=1), 0)
+
+
 @pytest.mark.use_numba
 @pytest.mark.parametrize(
     "func,deriv,norm",
@@ -161,6 +251,84 @@ def test_associated_legendre_function_derivative_analytical(func, norm, deriv):
                 )
 
 
+@pytest.mark.use_numba
+@pytest.mark.parametrize(
+    "func,deriv,fused",
+    (
+        (
+            associated_legendre,
+            associated_legendre_derivative,
+            associated_legendre_with_derivative,
+        ),
+        (
+            associated_legendre_schmidt,
+            associated_legendre_schmidt_derivative,
+            associated_legendre_schmidt_with_derivative,
+        ),
+        (
+            associated_legendre_full,
+            associated_legendre_full_derivative,
+            associated_legendre_full_with_derivative,
+        ),
+    ),
+    ids=["unnormalized", "schmidt", "full"],
+)
+def test_associated_legendre_function_with_derivative(func, deriv, fused):
+    "Check that the fused functions match computing values and derivatives"
+    max_degree = 12
+    p, dp = np.zeros((2, max_degree + 1, max_degree + 1))
+    p_fused, dp_fused = np.zeros((2, max_degree + 1, max_degree + 1))
+    for x in np.linspace(-1, 1, 50):
+        func(x, max_degree, p)
+        deriv(max_degree, p, dp)
+        fused(x, max_degree, p_fused, dp_fused)
+        # The fused functions rescale each degree separately and scale the
+        # unnormalized functions too, so they are rounded differently. Only
+        # the last bits of the results change, so compare them with a
+        # tolerance.
+        np.testing.assert_allclose(p_fused, p, rtol=1e-10, atol=1e-10)
+        np.testing.assert_allclose(dp_fused, dp, rtol=1e-10, atol=1e-10)
+
+
+@pytest.mark.use_numba
+@pytest.mark.parametrize(
+    "func,deriv,fused,coefs",
+    (
+        (
+            associated_legendre_schmidt,
+            associated_legendre_schmidt_derivative,
+            associated_legendre_schmidt_with_derivative,
+            associated_legendre_schmidt_coefficients,
+        ),
+        (
+            associated_legendre_full,
+            associated_legendre_full_derivative,
+            associated_legendre_full_with_derivative,
+            associated_legendre_full_coefficients,
+        ),
+    ),
+    ids=["schmidt", "full"],
+)
+def test_associated_legendre_function_with_derivative_precomputed_coefficients(
+    func, deriv, fused, coefs
+):
+    "Check the fused functions with precomputed coefficients"
+    max_degree = 12
+    coefficients = coefs(max_degree)
+    p, dp = np.zeros((2, max_degree + 1, max_degree + 1))
+    p_fused, dp_fused = np.zeros((2, max_degree + 1, max_degree + 1))
+    for x in np.linspace(-1, 1, 50):
+        func(x, max_degree, p)
+        deriv(max_degree, p, dp)
+        fused(x, max_degree, p_fused, dp_fused, coefficients)
+        # The precomputed coefficients are rounded differently than the ones
+        # computed along the recursion, and the fused multiply-adds allowed by
+        # fastmath are applied differently on each loop. Only the last bits of
+        # the results change, so compare them with a tolerance.
+        np.testing.assert_allclose(p_fused, p, rtol=1e-10, atol=1e-10)
+        np.testing.assert_allclose(dp_fused, dp, rtol=1e-10, atol=1e-10)
+
+
 class BaseSchmidt:
     """
     Base class to run tests using Schmidt identity.
@@ -169,13 +337,20 @@ class BaseSchmidt:
     Degrees higher than 2800 lead to bad results.
     """
 
-    def test_associated_legengre_function_schmidt_identity(self):
+    @pytest.mark.parametrize(
+        "precomputed", (False, True), ids=["default", "precomputed"]
+    )
+    def test_associated_legengre_function_schmidt_identity(self, precomputed):
         "Check Schmidt normalized functions against a known identity"
         # The sum of the coefs squared for a degree should be 1
         true_value = np.ones(self.max_degree + 1)
         p = np.zeros((self.max_degree + 1, self.max_degree + 1))
+        coefficients = associated_legendre_schmidt_coefficients(self.max_degree)
         for x in np.linspace(-1, 1, 50):
-            associated_legendre_schmidt(x, self.max_degree, p)
+            if precomputed:
+                associated_legendre_schmidt(x, self.max_degree, p, coefficients)
+            else:
+                associated_legendre_schmidt(x, self.max_degree, p)
             np.testing.assert_allclose(
                 (p**2).sum(axis=1), true_value, atol=1e-10, rtol=0
             )
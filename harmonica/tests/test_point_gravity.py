@@ -769,6 +769,84 @@ def test_point_mass_spherical_parallel():
         npt.assert_allclose(result_serial, result_parallel)
 
 
+@pytest.mark.use_numba
+def test_point_gravity_broadcast_coordinates():
+    """
+    Test if coordinates with different shapes are broadcasted
+    """
+    points = [[-10, 10], [0, 5], [-100, -50]]
+    masses = [1e4, 2e4]
+    easting, northing, upward = vd.grid_coordinates(
+        region=(-50, 50, -50, 50), shape=(3, 4), extra_coords=10
+    )
+    expected = point_gravity((easting, northing, upward), points, masses, "g_z")
+    # Pass upward as a scalar
+    result = point_gravity((easting, northing, 10), points, masses, "g_z")
+    assert result.shape == expected.shape
+    npt.assert_allclose(result, expected)
+    # Pass easting and northing as 1d arrays that broadcast to the grid
+    result = point_gravity((easting[0], northing[:, :1], upward), points, masses, "g_z")
+    assert result.shape == expected.shape
+    npt.assert_allclose(result, expected)
+
+
+@pytest.mark.use_numba
+@pytest.mark.parametrize(
+    "coordinate_system, field",
+    (
+        ("cartesian", "potential"),
+        ("cartesian", "g_z"),
+        ("cartesian", "g_zz"),
+        ("spherical", "potential"),
+        ("spherical", "g_z"),
+    ),
+)
+def test_point_gravity_float32(coordinate_system, field):
+    """
+    Check that results with float32 dtype match the float64 ones
+    """
+    if coordinate_system == "cartesian":
+        region = (2e3, 10e3, -3e3, 5e3)
+        points = vd.scatter_points(region, size=30, extra_coords=-1e3, random_state=0)
+        coordinates = vd.grid_coordinates(region=region, spacing=1e3, extra_coords=0)
+    else:
+        region = (2, 10, -3, 5)
+        radius = 6400e3
+        points = vd.scatter_points(
+            region, size=30, extra_coords=radius - 10e3, random_state=0
+        )
+        coordinates = vd.grid_coordinates(region=region, spacing=1, extra_coords=radius)
+    masses = np.arange(points[0].size) + 1e3
+    kwargs = dict(field=field, coordinate_system=coordinate_system)
+    result_float32 = point_gravity(
+        coordinates, points, masses, dtype="float32", **kwargs
+    )
+    result_float64 = point_gravity(coordinates, points, masses, **kwargs)
+    assert result_float32.dtype == np.float32
+    npt.assert_allclose(result_float32, result_float64, rtol=1e-6)
+
+
+@pytest.mark.use_numba
+@pytest.mark.parametrize("parallel", (True, False))
+@pytest.mark.parametrize("field", ("potential", "g_z"))
+def test_point_gravity_integer_coordinates_spherical(field, parallel):
+    """
+    Check that integer spherical coordinates give the same results as floats
+    """
+    coordinates = (np.array([10, 20]), np.array([45, 30]), np.array([6400000] * 2))
+    points = (np.array([11]), np.array([44]), np.array([6300000]))
+    masses = np.array([1e10])
+    kwargs = dict(field=field, coordinate_system="spherical", parallel=parallel)
+    result_int = point_gravity(coordinates, points, masses, **kwargs)
+    result_float = point_gravity(
+        tuple(c.astype(np.float64) for c in coordinates),
+        tuple(p.astype(np.float64) for p in points),
+        masses,
+        **kwargs,
+    )
+    npt.assert_allclose(result_int, result_float)
+
+
 class TestAgainstChoclo:
     """
     Test forward modelling functions against dumb Choclo runs
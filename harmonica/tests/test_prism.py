@@ -124,6 +124,29 @@ def test_forward_with_null_prisms():
     )
 
 
+@pytest.mark.use_numba
+def test_forward_broadcast_coordinates():
+    """
+    Test if coordinates with different shapes are broadcasted
+    """
+    prisms = [[-100, 100, -200, 200, -10e3, -5e3]]
+    density = [2600]
+    easting, northing, upward = vd.grid_coordinates(
+        region=(-50, 50, -50, 50), shape=(3, 3), extra_coords=10
+    )
+    expected = prism_gravity((easting, northing, upward), prisms, density, "g_z")
+    # Pass upward as a scalar
+    result = prism_gravity((easting, northing, 10), prisms, density, "g_z")
+    assert result.shape == expected.shape
+    npt.assert_allclose(result, expected)
+    # Pass easting and northing as 1d arrays that broadcast to the grid
+    result = prism_gravity(
+        (easting[0], northing[:, :1], upward), prisms, density, "g_z"
+    )
+    assert result.shape == expected.shape
+    npt.assert_allclose(result, expected)
+
+
 @pytest.mark.use_numba
 def test_disable_checks():
     "Check if the disable_checks flag works properly"
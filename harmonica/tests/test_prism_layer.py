@@ -17,7 +17,6 @@ import verde as vd
 import xarray as xr
 
 from .. import prism_gravity, prism_layer
-from .._forward.prism_layer import _discard_thin_prisms
 
 try:
     import pyvista
@@ -106,6 +105,21 @@ def test_prism_layer(dummy_layer):
     npt.assert_allclose(layer.bottom, expected_bottom)
 
 
+def test_prism_layer_meshgrid_coordinates(dummy_layer):
+    """
+    Check if a layer of prisms is built out of 2d coordinates
+    """
+    (easting, northing), surface, reference, _ = dummy_layer
+    layer = prism_layer((easting, northing), surface, reference)
+    layer_2d = prism_layer(np.meshgrid(easting, northing), surface, reference)
+    xr.testing.assert_identical(layer, layer_2d)
+    # Check if error is raised if 2d coordinates are not meshgrids
+    easting_2d, northing_2d = np.meshgrid(easting, northing)
+    easting_2d[1, 2] = -22
+    with pytest.raises(ValueError, match="must be meshgrids"):
+        prism_layer((easting_2d, northing_2d), surface, reference)
+
+
 def test_prism_layer_invalid_surface_reference(
     dummy_layer,
 ):
@@ -124,6 +138,30 @@ def test_prism_layer_invalid_surface_reference(
         prism_layer(coordinates, surface, reference_invalid)
 
 
+@pytest.mark.parametrize(
+    "surface_dtype, reference, expected_dtype",
+    [
+        (np.float32, 0, np.float32),
+        (np.float32, 0.0, np.float32),
+        (np.float32, np.zeros((3, 4), dtype=np.float64), np.float64),
+        (np.float64, 0, np.float64),
+        (np.int64, 0, np.float64),
+    ],
+)
+def test_prism_layer_top_bottom_dtype(surface_dtype, reference, expected_dtype):
+    """
+    Check if the top and bottom keep the precision of surface and reference
+    """
+    easting = np.linspace(1, 3, 4)
+    northing = np.linspace(7, 10, 3)
+    surface = np.arange(12, dtype=surface_dtype).reshape(3, 4) - 5
+    layer = prism_layer((easting, northing), surface, reference)
+    assert layer.top.dtype == expected_dtype
+    assert layer.bottom.dtype == expected_dtype
+    npt.assert_allclose(layer.top, np.maximum(surface, reference))
+    npt.assert_allclose(layer.bottom, np.minimum(surface, reference))
+
+
 def test_prism_layer_properties(dummy_layer):
     """
     Check passing physical properties to the prisms layer
@@ -206,6 +244,96 @@ def test_prism_layer_to_prisms():
     npt.assert_allclose(expected_prisms, layer.prism_layer._to_prisms())
 
 
+def test_prism_layer_gravity_top_modified_in_place():
+    """
+    Check if the gravity of the layer reflects in place changes of its top
+    """
+    coordinates = (np.array([0, 1]), np.array([0, 1]))
+    reference = np.zeros((2, 2))
+    surface = np.full((2, 2), 10.0)
+    layer = prism_layer(
+        coordinates, surface, reference, properties={"density": np.ones((2, 2))}
+    )
+    point = (0.5, 0.5, 100)
+    before = layer.prism_layer.gravity(point, field="g_z")
+    layer.top.values[:] = 50.0
+    after = layer.prism_layer.gravity(point, field="g_z")
+    expected = prism_gravity(
+        point,
+        prisms=layer.prism_layer._to_prisms(),
+        density=np.ones(4),
+        field="g_z",
+    )
+    assert not np.allclose(before, after)
+    npt.assert_allclose(after, expected)
+    npt.assert_allclose(layer.prism_layer._to_prisms()[:, -1], 50.0)
+
+
+def test_prism_layer_top_reassigned():
+    """
+    Check if the layer reflects a top coordinate reassigned through xarray
+    """
+    coordinates = (np.array([0, 1]), np.array([0, 1]))
+    reference = np.zeros((2, 2))
+    surface = np.full((2, 2), 10.0)
+    layer = prism_layer(coordinates, surface, reference)
+    # Access the boundaries of a prism before reassigning the top
+    assert layer.prism_layer.get_prism((0, 0))[-1] == 10.0
+    layer["top"] = (layer.prism_layer.dims, np.full((2, 2), 50.0))
+    assert layer.prism_layer.get_prism((0, 0))[-1] == 50.0
+    npt.assert_allclose(layer.prism_layer._to_prisms()[:, -1], 50.0)
+
+
+def test_prism_layer_easting_reassigned():
+    """
+    Check if the layer reflects an easting coordinate reassigned through xarray
+    """
+    coordinates = (np.array([0.0, 1.0]), np.array([0.0, 1.0]))
+    reference = np.zeros((2, 2))
+    surface = np.full((2, 2), 10.0)
+    layer = prism_layer(coordinates, surface, reference)
+    # Access the horizontal boundaries before reassigning the easting
+    npt.assert_allclose(layer.prism_layer.boundaries, (-0.5, 1.5, -0.5, 1.5))
+    npt.assert_allclose(layer.prism_layer._to_prisms()[:, :2].min(), -0.5)
+    layer["easting"] = layer.easting + 1000.0
+    npt.assert_allclose(layer.prism_layer.boundaries, (999.5, 1001.5, -0.5, 1.5))
+    expected_prisms = [
+        [999.5, 1000.5, -0.5, 0.5, 0, 10],
+        [1000.5, 1001.5, -0.5, 0.5, 0, 10],
+        [999.5, 1000.5, 0.5, 1.5, 0, 10],
+        [1000.5, 1001.5, 0.5, 1.5, 0, 10],
+    ]
+    npt.assert_allclose(layer.prism_layer._to_prisms(), expected_prisms)
+    # Check the spacing is recomputed too
+    layer["easting"] = layer.easting * 2
+    assert layer.prism_layer.spacing == (1.0, 2.0)
+
+
+def test_prism_layer_to_prisms_filtered():
+    """
+    Check if _to_prisms_filtered() discards nans and thin prisms
+    """
+    coordinates = (np.array([0, 1]), np.array([0, 1]))
+    reference = 0
+    surface = np.array([[10, np.nan], [2, 13]])
+    density = np.array([[2670, 2670], [2670, np.nan]])
+    layer = prism_layer(coordinates, surface, reference, {"density": density})
+    # Check discarding only prisms with nans
+    with pytest.warns(UserWarning):
+        prisms, rho = layer.prism_layer._to_prisms_filtered("density")
+    npt.assert_allclose(
+        prisms, [[-0.5, 0.5, -0.5, 0.5, 0, 10], [-0.5, 0.5, 0.5, 1.5, 0, 2]]
+    )
+    npt.assert_allclose(rho, [2670, 2670])
+    # Check discarding thin prisms as well
+    with pytest.warns(UserWarning):
+        prisms, rho = layer.prism_layer._to_prisms_filtered(
+            "density", thickness_threshold=5
+        )
+    npt.assert_allclose(prisms, [[-0.5, 0.5, -0.5, 0.5, 0, 10]])
+    npt.assert_allclose(rho, [2670])
+
+
 def test_prism_layer_get_prism_by_index():
     """
     Check if the right prism is returned after index
@@ -534,42 +662,3 @@ def test_gravity_discarded_thin_prisms(dummy_layer):
         coordinates, field="g_z", thickness_threshold=5
     )
     npt.assert_allclose(gravity_manually_removed, gravity_threshold_removed)
-
-
-def test_discard_thin_prisms():
-    """
-    Check if thin prisms are properly discarded.
-    """
-    # create set of 4 prisms (west, east, south, north, bottom, top)
-    prism_boundaries = np.array(
-        [
-            [-5000.0, 5000.0, -5000.0, 5000.0, 0.0, 55.1],
-            [5000.0, 15000.0, -5000.0, 5000.0, 0.0, 55.01],
-            [-5000.0, 5000.0, 5000.0, 15000.0, 0.0, 35.0],
-            [5000.0, 15000.0, 5000.0, 15000.0, 0.0, 84.0],
-        ]
-    )
-
-    # assign densities to each prism
-    densities = np.array([2306, 2122, 2190, 2069])
-
-    # drop prisms and respective densities thinner than 55.05
-    # (2nd and 3rd prisms)
-    thick_prisms, thick_densities = _discard_thin_prisms(
-        prism_boundaries,
-        densities,
-        thickness_threshold=55.05,
-    )
-
-    # manually remove prisms and densities of thin prisms
-    expected_prisms = np.array(
-        [
-            [-5000.0, 5000.0, -5000.0, 5000.0, 0.0, 55.1],
-            [5000.0, 15000.0, 5000.0, 15000.0, 0.0, 84.0],
-        ]
-    )
-    expected_densities = np.array([2306, 2069])
-
-    # check the correct prisms and densities were discarded
-    npt.assert_allclose(expected_prisms, thick_prisms)
-    npt.assert_allclose(expected_densities, thick_densities)